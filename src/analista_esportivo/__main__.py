@@ -1,7 +1,14 @@
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.network.urlrequest import UrlRequest
 from kivy.utils import get_color_from_hex
+# buildozer e a execução direta do arquivo usam src/analista_esportivo como raiz;
+# `python -m` e o briefcase importam pelo pacote.
+try:
+    from atualizacao import aplicar_alteracoes, obter_etag, proximo_intervalo
+except ImportError:
+    from analista_esportivo.atualizacao import aplicar_alteracoes, obter_etag, proximo_intervalo
 import json
 import os
 import sys
@@ -11,6 +18,15 @@ import sys
 API_DADOS_URL = 'https://cdn.jsdelivr.net/gh/openfootball/football.json@master/2024-25/nl.1.json' 
 # *******************************************************************
 
+# Atualização automática (polling). O intervalo começa no mínimo, dobra a cada
+# consulta sem alterações ou com falha, até o máximo, e volta ao mínimo assim
+# que chegam alterações ou quando o usuário toca em "Atualizar".
+ATUALIZACAO_AUTOMATICA = True
+INTERVALO_MINIMO = 30   # segundos
+INTERVALO_MAXIMO = 600  # segundos
+FATOR_BACKOFF = 2
+TEMPO_LIMITE = 20       # segundos; uma conexão travada cai em on_error
+
 # Código KV do layout (Dark Mode)
 kv_code = """
 BoxLayout:
@@ -63,6 +79,7 @@ BoxLayout:
 
 <JogoItem@BoxLayout>:
     # Item da lista
+    chave: '' # Identificador estável do jogo, usado nas atualizações incrementais
     horario: ''
     times: ''
     canal: '' # Este dado não está no JSON, será um placeholder
@@ -128,27 +145,82 @@ class MainApp(App):
         return self.root
 
     def on_start(self):
+        self._etag = None
+        self._requisicao = None
+        self._proxima_busca = None
+        self._intervalo = INTERVALO_MINIMO
+        self._busca_manual = False
         # Inicia a busca de dados assim que o app começa
         self.buscar_dados()
 
+    def on_stop(self):
+        if self._proxima_busca is not None:
+            self._proxima_busca.cancel()
+
     def buscar_dados(self, *args):
         """Função para buscar dados assincronamente do arquivo JSON estático."""
-        self.root.ids.status_label.text = 'Buscando dados...'
-        
+        if self._requisicao is not None and not self._requisicao.is_finished:
+            if not args:
+                self.root.ids.status_label.text = 'Atualização já em andamento...'
+            return
+
+        # Busca manual (botão "Atualizar") cancela a espera e zera o backoff;
+        # as buscas agendadas pelo Clock recebem o dt como argumento.
+        self._busca_manual = not args
+        if self._proxima_busca is not None:
+            self._proxima_busca.cancel()
+            self._proxima_busca = None
+
+        if not self.root.ids.lista_jogos.data:
+            self.root.ids.status_label.text = 'Buscando dados...'
+
+        # Com ETag o servidor responde 304 sem corpo quando nada mudou.
+        cabecalhos = {'If-None-Match': self._etag} if self._etag else None
+
         # Faz a requisição HTTP para o arquivo JSON público.
-        UrlRequest(
+        self._requisicao = UrlRequest(
             API_DADOS_URL,
+            req_headers=cabecalhos,
+            timeout=TEMPO_LIMITE,
             on_success=self.parse_api_response,
+            on_redirect=self.on_redirect,
             on_failure=self.on_error,
             on_error=self.on_error,
             on_progress=lambda req, cur, total: self.root.ids.status_label.text == f'Baixando: {cur}/{total} bytes'
         )
 
+    def agendar_proxima_busca(self, houve_alteracao):
+        """Agenda a próxima consulta, aplicando backoff quando nada muda ou há falha."""
+        if not ATUALIZACAO_AUTOMATICA:
+            return
+
+        self._intervalo = proximo_intervalo(
+            self._intervalo, houve_alteracao, self._busca_manual,
+            INTERVALO_MINIMO, INTERVALO_MAXIMO, FATOR_BACKOFF
+        )
+        self._busca_manual = False
+        if self._proxima_busca is not None:
+            self._proxima_busca.cancel()
+        self._proxima_busca = Clock.schedule_once(self.buscar_dados, self._intervalo)
+
     def on_error(self, req, error):
         """Lida com falhas de rede ou HTTP."""
         error_msg = f'Erro de conexão ao buscar dados.'
         print(f"Erro ao buscar dados: {error}")
         self.root.ids.status_label.text = error_msg
+        self.agendar_proxima_busca(houve_alteracao=False)
+
+    def on_redirect(self, req, result):
+        """O UrlRequest entrega qualquer 3xx aqui, inclusive o 304 do ETag."""
+        if req.resp_status != 304:
+            self.on_error(req, f'Redirecionamento inesperado (HTTP {req.resp_status}).')
+            return
+
+        # Nada mudou desde a última consulta.
+        self.root.ids.status_label.text = (
+            f'{len(self.root.ids.lista_jogos.data)} jogos: nenhuma alteração.'
+        )
+        self.agendar_proxima_busca(houve_alteracao=False)
 
     def parse_api_response(self, req, result):
         """
@@ -162,10 +234,14 @@ class MainApp(App):
 
             dados_limpos = []
             campeonato_nome = dados.get('name', 'Dados da Liga')
+            ocorrencias = {}
 
             for item in jogos:
+                time1 = item.get('team1', {}).get('name', 'N/A')
+                time2 = item.get('team2', {}).get('name', 'N/A')
+
                 # Combina os nomes dos times
-                times_str = f"{item.get('team1', {}).get('name', 'N/A')} x {item.get('team2', {}).get('name', 'N/A')}"
+                times_str = f"{time1} x {time2}"
                 
                 # Combina data e hora
                 horario_str = f"{item.get('date', '')} {item.get('time', 'N/A')}"
@@ -173,20 +249,41 @@ class MainApp(App):
                 # O JSON não tem a coluna 'canal', então colocamos um placeholder informativo.
                 canal_str = "Sem Info de TV" 
                 
+                # Rodada + times identificam o jogo mesmo se a data mudar; o
+                # contador garante chave única se o confronto se repetir.
+                chave = f"{item.get('round', '')}|{time1}|{time2}"
+                ocorrencias[chave] = ocorrencias.get(chave, 0) + 1
+                if ocorrencias[chave] > 1:
+                    chave = f"{chave}#{ocorrencias[chave]}"
+
                 dados_limpos.append({
+                    'chave': chave,
                     'horario': horario_str,
                     'times': times_str,
                     'canal': canal_str,
                     'campeonato': campeonato_nome,
                 })
             
-            self.root.ids.lista_jogos.data = dados_limpos
-            self.root.ids.status_label.text = f'{len(dados_limpos)} jogos carregados ({campeonato_nome}).'
+            inseridos, atualizados, removidos = aplicar_alteracoes(
+                self.root.ids.lista_jogos.data, dados_limpos
+            )
+            alterados = inseridos + atualizados + removidos
+
+            etag = obter_etag(req.resp_headers)
+            if etag:
+                self._etag = etag
+
+            self.root.ids.status_label.text = (
+                f'{len(dados_limpos)} jogos ({campeonato_nome}): '
+                f'+{inseridos} ~{atualizados} -{removidos}'
+            )
+            self.agendar_proxima_busca(houve_alteracao=alterados > 0)
 
         except Exception as e:
             error_msg = f"Erro ao processar dados JSON: {e}"
             print(error_msg)
             self.root.ids.status_label.text = error_msg
+            self.agendar_proxima_busca(houve_alteracao=False)
 
 
 if __name__ == '__main__':
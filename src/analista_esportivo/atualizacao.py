@@ -0,0 +1,105 @@
+"""Comparação incremental da lista de jogos e backoff do polling (sem dependência do Kivy)."""
+from bisect import bisect_left
+
+
+def _identificadores(jogos):
+    """(chave, ocorrência) de cada jogo, para que chaves repetidas não se confundam."""
+    ocorrencias = {}
+    identificadores = []
+    for jogo in jogos:
+        chave = jogo['chave']
+        ocorrencias[chave] = ocorrencias.get(chave, 0) + 1
+        identificadores.append((chave, ocorrencias[chave]))
+    return identificadores
+
+
+def _mantidos_no_lugar(posicoes):
+    """Índices da maior subsequência crescente de `posicoes`: as linhas que não precisam sair do lugar."""
+    finais = []
+    indices_finais = []
+    anterior = [-1] * len(posicoes)
+    for indice, posicao in enumerate(posicoes):
+        tamanho = bisect_left(finais, posicao)
+        if tamanho == len(finais):
+            finais.append(posicao)
+            indices_finais.append(indice)
+        else:
+            finais[tamanho] = posicao
+            indices_finais[tamanho] = indice
+        anterior[indice] = indices_finais[tamanho - 1] if tamanho else -1
+
+    mantidos = set()
+    indice = indices_finais[-1] if indices_finais else -1
+    while indice != -1:
+        mantidos.add(indice)
+        indice = anterior[indice]
+    return mantidos
+
+
+def aplicar_alteracoes(dados, novos):
+    """
+    Compara os jogos novos com os de `dados` pela 'chave' e altera `dados` no
+    lugar, só nas linhas que mudaram. `dados` pode ser a lista do RecycleView
+    (ObservableList) ou uma lista comum. Jogos que mudaram de posição saem e
+    voltam no lugar novo e contam como atualizados.
+    Retorna (inseridos, atualizados, removidos).
+    """
+    # Primeiro carregamento: uma única atribuição em vez de uma inserção por linha.
+    if not dados:
+        if novos:
+            dados[:] = novos
+        return len(novos), 0, 0
+
+    ids_antigos = _identificadores(dados)
+    ids_novos = _identificadores(novos)
+    posicao_nova = {identificador: indice for indice, identificador in enumerate(ids_novos)}
+    antigos_por_id = dict(zip(ids_antigos, dados))
+
+    # Dos jogos mantidos, só os que ficam fora da maior sequência já ordenada se movem.
+    mantidos = [i for i, identificador in enumerate(ids_antigos) if identificador in posicao_nova]
+    no_lugar = _mantidos_no_lugar([posicao_nova[ids_antigos[i]] for i in mantidos])
+    movidos = {ids_antigos[i] for n, i in enumerate(mantidos) if n not in no_lugar}
+
+    removidos = len(ids_antigos) - len(mantidos)
+    inseridos = sum(1 for identificador in ids_novos if identificador not in antigos_por_id)
+    atualizados = sum(
+        1 for identificador, jogo in zip(ids_novos, novos)
+        if identificador in movidos
+        or (identificador in antigos_por_id and antigos_por_id[identificador] != jogo)
+    )
+
+    # Remoções (e retirada dos movidos), de trás para frente para não deslocar os índices pendentes.
+    for indice in range(len(dados) - 1, -1, -1):
+        identificador = ids_antigos[indice]
+        if identificador not in posicao_nova or identificador in movidos:
+            del dados[indice]
+            del ids_antigos[indice]
+
+    # Inserções, reinserção dos movidos e atualizações; o que sobrou já está na ordem nova.
+    for indice, (identificador, jogo) in enumerate(zip(ids_novos, novos)):
+        if indice < len(ids_antigos) and ids_antigos[indice] == identificador:
+            if dados[indice] != jogo:
+                dados[indice] = jogo
+        else:
+            dados.insert(indice, jogo)
+            ids_antigos.insert(indice, identificador)
+
+    return inseridos, atualizados, removidos
+
+
+def proximo_intervalo(atual, houve_alteracao, manual, minimo, maximo, fator):
+    """
+    Intervalo até a próxima consulta: volta ao mínimo após alterações ou uma
+    busca manual; caso contrário multiplica pelo fator, limitado ao máximo.
+    """
+    if houve_alteracao or manual:
+        return minimo
+    return min(atual * fator, maximo)
+
+
+def obter_etag(cabecalhos):
+    """ETag da resposta; o Kivy preserva a capitalização enviada pelo servidor."""
+    return next(
+        (valor for nome, valor in (cabecalhos or {}).items() if nome.lower() == 'etag'),
+        None
+    )
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from analista_esportivo.__main__ import MainApp
+
+
+def app_falso():
+    chamadas = []
+    return SimpleNamespace(
+        root=SimpleNamespace(ids=SimpleNamespace(
+            status_label=SimpleNamespace(text=''),
+            lista_jogos=SimpleNamespace(data=[{'chave': 'a'}, {'chave': 'b'}]),
+        )),
+        chamadas=chamadas,
+        agendar_proxima_busca=lambda houve_alteracao: chamadas.append(('agendar', houve_alteracao)),
+        on_error=lambda req, erro: chamadas.append(('erro', erro)),
+    )
+
+
+def test_304_reagenda_sem_alteracao():
+    app = app_falso()
+    MainApp.on_redirect(app, SimpleNamespace(resp_status=304), None)
+    assert app.chamadas == [('agendar', False)]
+    assert app.root.ids.status_label.text == '2 jogos: nenhuma alteração.'
+
+
+def test_outro_redirecionamento_vira_erro():
+    app = app_falso()
+    MainApp.on_redirect(app, SimpleNamespace(resp_status=301), None)
+    assert [nome for nome, _ in app.chamadas] == ['erro']
@@ -0,0 +1,139 @@
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from analista_esportivo.atualizacao import aplicar_alteracoes, obter_etag, proximo_intervalo
+
+PASTA_APP = Path(__file__).resolve().parents[1] / 'src' / 'analista_esportivo'
+
+
+class ListaRegistrada(list):
+    """Lista que anota as operações feitas, como o ObservableList notifica o RecycleView."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.operacoes = []
+
+    def __setitem__(self, indice, valor):
+        self.operacoes.append(('set', indice))
+        super().__setitem__(indice, valor)
+
+    def __delitem__(self, indice):
+        self.operacoes.append(('del', indice))
+        super().__delitem__(indice)
+
+    def insert(self, indice, valor):
+        self.operacoes.append(('insert', indice))
+        super().insert(indice, valor)
+
+
+def jogo(chave, horario=''):
+    return {'chave': chave, 'horario': horario}
+
+
+def chaves(dados):
+    return [item['chave'] for item in dados]
+
+
+def test_primeiro_carregamento():
+    dados = []
+    novos = [jogo('1|Ajax|PSV'), jogo('1|AZ|Twente')]
+    assert aplicar_alteracoes(dados, novos) == (2, 0, 0)
+    assert dados == novos
+
+
+def test_sem_alteracoes():
+    dados = ListaRegistrada([jogo('a'), jogo('b')])
+    assert aplicar_alteracoes(dados, [jogo('a'), jogo('b')]) == (0, 0, 0)
+    assert dados.operacoes == []
+
+
+def test_insercao():
+    dados = [jogo('a'), jogo('c')]
+    assert aplicar_alteracoes(dados, [jogo('a'), jogo('b'), jogo('c'), jogo('d')]) == (2, 0, 0)
+    assert chaves(dados) == ['a', 'b', 'c', 'd']
+
+
+def test_remocao():
+    dados = [jogo('a'), jogo('b'), jogo('c')]
+    assert aplicar_alteracoes(dados, [jogo('b')]) == (0, 0, 2)
+    assert chaves(dados) == ['b']
+
+
+def test_atualizacao():
+    dados = ListaRegistrada([jogo('a'), jogo('b', '15:00')])
+    assert aplicar_alteracoes(dados, [jogo('a'), jogo('b', '16:00')]) == (0, 1, 0)
+    assert dados[1] == jogo('b', '16:00')
+    assert dados.operacoes == [('set', 1)]
+
+
+def test_jogo_movido_conta_como_atualizado_e_so_ele_muda():
+    dados = ListaRegistrada([jogo('a'), jogo('b'), jogo('c'), jogo('d')])
+    novos = [jogo('b'), jogo('c'), jogo('d'), jogo('a')]
+    assert aplicar_alteracoes(dados, novos) == (0, 1, 0)
+    assert dados == novos
+    assert dados.operacoes == [('del', 0), ('insert', 3)]
+
+
+def test_jogo_remarcado_dentro_da_rodada():
+    dados = [jogo('1|Ajax|PSV', '15:00'), jogo('1|AZ|Twente', '17:00'), jogo('1|Feyenoord|Utrecht', '19:00')]
+    novos = [jogo('1|AZ|Twente', '17:00'), jogo('1|Feyenoord|Utrecht', '19:00'), jogo('1|Ajax|PSV', '21:00')]
+    assert aplicar_alteracoes(dados, novos) == (0, 1, 0)
+    assert dados == novos
+
+
+def test_chaves_repetidas():
+    # Lista antiga com o mesmo confronto duas vezes (sem o sufixo #n).
+    dados = [jogo('1|Ajax|PSV', '15:00'), jogo('1|Ajax|PSV', '15:00')]
+    novos = [jogo('1|Ajax|PSV', '15:00'), jogo('1|Ajax|PSV#2', '15:00'), jogo('2|PSV|Ajax', '16:00')]
+    assert aplicar_alteracoes(dados, novos) == (2, 0, 1)
+    assert dados == novos
+
+    # Repetição na entrada: cada ocorrência é comparada com a de mesma ordem.
+    dados = [jogo('1|Ajax|PSV', '15:00'), jogo('1|AZ|Twente', '17:00')]
+    novos = [jogo('1|Ajax|PSV', '15:00'), jogo('1|Ajax|PSV', '16:00'), jogo('1|AZ|Twente', '18:00')]
+    assert aplicar_alteracoes(dados, novos) == (1, 1, 0)
+    assert dados == novos
+
+
+def test_listas_aleatorias_terminam_iguais():
+    sorteio = random.Random(26)
+    for _ in range(2000):
+        dados = [jogo(sorteio.randrange(8), sorteio.choice('xy')) for _ in range(sorteio.randrange(6))]
+        novos = [jogo(sorteio.randrange(8), sorteio.choice('xy')) for _ in range(sorteio.randrange(6))]
+        tamanho_antigo = len(dados)
+        inseridos, atualizados, removidos = aplicar_alteracoes(dados, novos)
+        assert dados == novos
+        assert inseridos - removidos == len(novos) - tamanho_antigo
+        assert inseridos + atualizados <= len(novos)
+
+
+def test_intervalo_dobra_sem_alteracao_ate_o_maximo():
+    intervalo = 30
+    sequencia = []
+    for _ in range(6):
+        intervalo = proximo_intervalo(intervalo, False, False, 30, 600, 2)
+        sequencia.append(intervalo)
+    assert sequencia == [60, 120, 240, 480, 600, 600]
+
+
+def test_intervalo_volta_ao_minimo():
+    assert proximo_intervalo(480, True, False, 30, 600, 2) == 30
+    assert proximo_intervalo(480, False, True, 30, 600, 2) == 30
+
+
+def test_obter_etag_ignora_capitalizacao():
+    assert obter_etag({'Etag': 'W/"1"'}) == 'W/"1"'
+    assert obter_etag({'ETAG': 'W/"2"', 'Content-Type': 'application/json'}) == 'W/"2"'
+    assert obter_etag({}) is None
+    assert obter_etag(None) is None
+
+
+def test_import_com_a_pasta_do_app_como_raiz():
+    # Como no buildozer (source.dir = src/analista_esportivo) e em `python __main__.py`.
+    codigo = 'from atualizacao import aplicar_alteracoes, obter_etag, proximo_intervalo'
+    resultado = subprocess.run(
+        [sys.executable, '-c', codigo], cwd=PASTA_APP, capture_output=True, text=True
+    )
+    assert resultado.returncode == 0, resultado.stderr